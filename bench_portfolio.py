@@ -0,0 +1,72 @@
+import ShiftScheduler # type: ignore
+import argparse
+import os
+import time
+
+from bench_threads import DAYS, build_problem
+from portfolio import default_strategies, run_portfolio
+
+# --- ポートフォリオ実行のベンチマーク ---
+# 「全個体を使った1回計算」と「同じ合計個体数を workers 個の戦略に分けて同時に走らせる」を
+# 何回か繰り返し、目標スコア到達までの時間の中央値と最悪値 (ばらつき) を比べる。
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+def summarize(label, times, successes, trials):
+    print(f"{label:<12} 到達 {successes}/{trials}回  "
+          f"中央値 {percentile(times, 0.5):7.2f}秒  "
+          f"p90 {percentile(times, 0.9):7.2f}秒  "
+          f"最悪 {max(times):7.2f}秒")
+
+def main():
+    parser = argparse.ArgumentParser(description="ポートフォリオ実行 vs 1回の大きな計算")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--population", type=int, default=10000, help="ポートフォリオ1本あたりの平均個体数")
+    parser.add_argument("--generations", type=int, default=1000)
+    parser.add_argument("--target", type=int, default=100)
+    parser.add_argument("--budget", type=float, default=60.0, help="1試行あたりの制限時間 [秒]")
+    parser.add_argument("--trials", type=int, default=5)
+    args = parser.parse_args()
+
+    roles_list, constraints = build_problem()
+    staff_count = len(roles_list)
+    # 合計個体数 (両方式で同じにする)
+    total_population = sum(s["population_size"] for s in default_strategies(args.workers, args.population * args.workers))
+
+    # 1. 1回の大きな計算 (全コア)
+    single_times, single_ok = [], 0
+    for _ in range(args.trials):
+        start = time.perf_counter()
+        _, score = ShiftScheduler.run_genetic_algorithm(
+            roles_list, constraints, DAYS, staff_count,
+            total_population, args.generations,
+            target_score=args.target, time_limit=args.budget, verbose=False
+        )
+        # 届かなかった試行は制限時間ぶんかかったものとして数える
+        elapsed = time.perf_counter() - start
+        single_times.append(elapsed if score >= args.target else args.budget)
+        single_ok += score >= args.target
+
+    # 2. ポートフォリオ (コアをプロセス数で分ける)
+    portfolio_times, portfolio_ok = [], 0
+    for _ in range(args.trials):
+        strategies = default_strategies(args.workers, total_population)
+        start = time.perf_counter()
+        _, score, _, _ = run_portfolio(
+            roles_list, constraints, DAYS, staff_count, strategies,
+            generations=args.generations, target_score=args.target,
+            time_budget=args.budget, log=lambda message: None
+        )
+        # プロセス起動時間も含めた実時間 (届かなかった試行は制限時間ぶん)
+        elapsed = time.perf_counter() - start
+        portfolio_times.append(elapsed if score >= args.target else args.budget)
+        portfolio_ok += score >= args.target
+
+    print(f"目標スコア {args.target} / 制限時間 {args.budget}秒 / {args.trials}試行 / {os.cpu_count()}コア")
+    summarize(f"1回計算({total_population})", single_times, single_ok, args.trials)
+    summarize(f"並列x{args.workers}({total_population})", portfolio_times, portfolio_ok, args.trials)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# --- 起動時間ベンチマーク ---
+# gui_app.py の import が軽いままか (openpyxl / ShiftScheduler を読み込んでいないか) を
+# 画面なしでチェックする。--gui を付けると実際にウィンドウを開いて
+# first_frame (画面表示) / ready (エンジン準備完了) までの時間も測る (要ディスプレイ)。
+
+HEAVY_MODULES = ["openpyxl", "ShiftScheduler"]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 新しいプロセスで import し、所要時間と読み込まれた重いモジュールを JSON で返す
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def probe_import(module):
+    code = IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True)
+    if out.returncode != 0:
+        return None
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def run_gui():
+    env = dict(os.environ, SHIFTAPP_STARTUP_BENCH="1")
+    out = subprocess.run([sys.executable, os.path.join(HERE, "gui_app.py")],
+                         cwd=HERE, env=env, capture_output=True, text=True, timeout=120)
+    if out.returncode != 0:
+        print(out.stderr)
+        return None
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI起動時間の測定")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=300.0,
+                        help="gui_app の import がこれを超えたら失敗扱い")
+    parser.add_argument("--gui", action="store_true", help="実際にウィンドウを開いて計測する")
+    args = parser.parse_args()
+
+    failed = False
+
+    # 1. gui_app 本体の import (= 画面表示前に必ず払うコスト)
+    results = [probe_import("gui_app") for _ in range(args.repeat)]
+    if None in results:
+        print("❌ gui_app の import に失敗しました")
+        return 1
+    import_ms = median([r["seconds"] for r in results]) * 1000
+    print(f"gui_app import: {import_ms:.1f} ms (中央値 / {args.repeat}回)")
+    if import_ms > args.max_import_ms:
+        print(f"❌ import が {args.max_import_ms:.0f} ms を超えています")
+        failed = True
+    leaked = results[0]["loaded"]
+    if leaked:
+        print(f"❌ 起動時に重いモジュールが読み込まれています: {', '.join(leaked)}")
+        failed = True
+
+    # 2. 後回しにしているモジュールの import 時間 (参考値)
+    for module in HEAVY_MODULES:
+        r = probe_import(module)
+        if r is None:
+            print(f"{module} import: (読み込み不可)")
+        else:
+            print(f"{module} import: {r['seconds'] * 1000:.1f} ms (バックグラウンドで読み込み)")
+
+    # 3. 実ウィンドウでの計測
+    if args.gui:
+        times = [run_gui() for _ in range(args.repeat)]
+        if None in times:
+            print("❌ GUIの起動に失敗しました")
+            return 1
+        first_frame = median([t["first_frame"] for t in times]) * 1000
+        ready = median([t["ready"] for t in times]) * 1000
+        print(f"time-to-first-frame: {first_frame:.1f} ms")
+        print(f"time-to-ready:       {ready:.1f} ms")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import ShiftScheduler # type: ignore
+import argparse
+import os
+import time
+
+# --- ベンチマーク設定 ---
+# 実データに近い構成 (gui_app.py の default_roles と同じ人数)
+ROLE_CONFIG = [
+    ("Chief",  5),
+    ("Leader", 2),
+    ("Staff",  3),
+    ("Assist", 10)
+]
+DAYS = 31
+# 途中で目標到達して止まらないように、届かないスコアを目標にする
+NEVER_REACHED = 10**9
+
+def build_problem():
+    roles_list = []
+    for role_name, count in ROLE_CONFIG:
+        roles_list.extend([role_name] * count)
+    # 希望休なし
+    constraints = {}
+    return roles_list, constraints
+
+def measure(roles_list, constraints, population, generations, num_threads, chunk_size, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ShiftScheduler.run_genetic_algorithm(
+            roles_list, constraints, DAYS, len(roles_list),
+            population, generations, num_threads, chunk_size,
+            target_score=NEVER_REACHED, verbose=False
+        )
+        times.append(time.perf_counter() - start)
+    # 外れ値の影響を避けるため中央値を使う
+    times.sort()
+    return times[len(times) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description="Rustエンジンのスレッド数スケーリング測定")
+    parser.add_argument("--population", type=int, default=20000)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    roles_list, constraints = build_problem()
+
+    # 1, 2, 4, 8, ... と最大スレッド数
+    thread_counts = []
+    n = 1
+    while n < args.max_threads:
+        thread_counts.append(n)
+        n *= 2
+    thread_counts.append(args.max_threads)
+
+    print(f"個体数{args.population} / {args.generations}世代 / chunk_size={args.chunk_size} / 各{args.repeat}回の中央値")
+    print(f"{'threads':>8} {'time[s]':>10} {'speedup':>8} {'efficiency':>11}")
+
+    base = None
+    for threads in thread_counts:
+        elapsed = measure(roles_list, constraints, args.population, args.generations,
+                          threads, args.chunk_size, args.repeat)
+        if base is None:
+            base = elapsed
+        speedup = base / elapsed
+        efficiency = speedup / threads
+        print(f"{threads:>8} {elapsed:>10.3f} {speedup:>8.2f} {efficiency:>10.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,43 @@
+import time
+APP_START = time.perf_counter()  # 起動時間計測の基準点
+
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, simpledialog
 import threading
-import time
+import multiprocessing
 import datetime
-import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.worksheet.datavalidation import DataValidation
 import unicodedata
 import json
 import os
 
-import ShiftScheduler
+# openpyxl と ShiftScheduler(Rust) は読み込みが重いので、ここでは import しない。
+# ウィンドウ表示後に warm_up() でバックグラウンド読み込みし、
+# 各機能の中でも必要になった時点で import する (2回目以降は sys.modules から即座に返る)。
 
 # --- デフォルト設定 ---
 DEFAULT_CONFIG = {
     "population_size": 50000,
     "generations": 1000,
+    "num_threads": 0,
+    "chunk_size": 0,
+    "portfolio_workers": 1,
+    "portfolio_time_budget": 60,
     "default_roles": {
         "Chief": 5, "Leader": 2, "Staff": 3, "Assist": 10
     }
 }
 WEEKDAYS = ["月", "火", "水", "木", "金", "土", "日"]
+CONFIG_FILE = "config.json"
+
+# config.json のキャッシュ (更新日時が変わったときだけ読み直す)
+_config_cache = {"mtime": None, "data": None}
+
+def warm_up():
+    """重いモジュールを先に読み込んでおく (バックグラウンドスレッド用)"""
+    import openpyxl
+    import openpyxl.styles
+    import openpyxl.worksheet.datavalidation
+    import ShiftScheduler
 
 class ShiftApp:
     def __init__(self, root):
@@ -28,9 +45,9 @@ class ShiftApp:
         self.root.title("シフト作成AI")
         self.root.geometry("700x650")
 
-        # 設定読み込み
-        self.config = self.load_config()
-        
+        # 起動時間の計測結果 (秒)
+        self.startup_times = {}
+
         # --- エリア1: テンプレート作成 ---
         frame_step1 = tk.LabelFrame(root, text="Step 1: 入力用ファイルの作成", padx=10, pady=10)
         frame_step1.pack(fill="x", padx=10, pady=5)
@@ -63,9 +80,48 @@ class ShiftApp:
         self.log_area.pack(fill="both", expand=True, padx=10, pady=10)
 
         self.status_var = tk.StringVar()
-        self.status_var.set("待機中")
+        self.status_var.set("起動準備中...")
         tk.Label(root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor="w").pack(side="bottom", fill="x")
 
+        # 設定読み込み (ログ欄を作ってから読むのでエラーも表示できる)
+        self.config = self.load_config()
+
+        # ウィンドウが表示されて最初の描画が終わったら重いモジュールの読み込みを始める
+        # (after_idle だと表示前に走ることがあり、読み込みスレッドが描画の邪魔をする)
+        self.root.bind("<Map>", self.on_first_frame)
+
+    def on_first_frame(self, event):
+        # 子ウィジェットの <Map> もここに来るので、ウィンドウ本体の1回目だけ扱う
+        if event.widget is not self.root:
+            return
+        self.root.unbind("<Map>")
+        # 溜まっている再描画を済ませてから計測する
+        self.root.update_idletasks()
+        self.startup_times["first_frame"] = time.perf_counter() - APP_START
+        # イベントループに一度戻して描画を確定させてから読み込みスレッドを起動
+        self.root.after(0, self.start_warm_up)
+
+    def start_warm_up(self):
+        threading.Thread(target=self.warm_up_engine, daemon=True).start()
+
+    def warm_up_engine(self):
+        try:
+            warm_up()
+            error = None
+        except Exception as e:
+            error = e
+        self.root.after(0, self.on_ready, error)
+
+    def on_ready(self, error):
+        self.startup_times["ready"] = time.perf_counter() - APP_START
+        if error is not None:
+            self.log(f"エンジン読み込みエラー: {error}")
+        # 読み込み完了前にシフト生成が始まっていたら、ステータスとログは計算側 (reset_gui) に任せる
+        if self.btn_run["state"] != "normal":
+            return
+        self.log(f"起動完了: 画面表示 {self.startup_times['first_frame']:.2f}秒 / 準備完了 {self.startup_times['ready']:.2f}秒")
+        self.status_var.set("待機中")
+
     def log(self, message):
         self.log_area.config(state='normal')
         self.log_area.insert(tk.END, message + "\n")
@@ -73,10 +129,14 @@ class ShiftApp:
         self.log_area.config(state='disabled')
 
     def load_config(self):
-        if os.path.exists("config.json"):
+        if os.path.exists(CONFIG_FILE):
             try:
-                with open("config.json", "r", encoding="utf-8") as f:
-                    return json.load(f)
+                mtime = os.path.getmtime(CONFIG_FILE)
+                if _config_cache["mtime"] != mtime:
+                    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                        _config_cache["data"] = json.load(f)
+                    _config_cache["mtime"] = mtime
+                return _config_cache["data"]
             except Exception as e:
                 self.log(f"設定読み込みエラー: {e}")
         return DEFAULT_CONFIG
@@ -117,6 +177,10 @@ class ShiftApp:
             messagebox.showerror("エラー", f"作成失敗: {e}")
 
     def generate_excel_template(self, year, shift_month, role_config):
+        import openpyxl
+        from openpyxl.styles import PatternFill, Font, Alignment
+        from openpyxl.worksheet.datavalidation import DataValidation
+
         end_date = datetime.date(year, shift_month, 25)
         if shift_month == 1:
             start_year = year - 1
@@ -199,6 +263,8 @@ class ShiftApp:
 
     def run_logic(self, input_file):
         try:
+            import ShiftScheduler
+
             self.log("データを読み込んでいます...")
             staff_count, days_count, roles, constraints, names, date_labels = self.load_data_clean(input_file)
             self.log(f"読み込み完了: {staff_count}名 / {days_count}日間")
@@ -207,13 +273,33 @@ class ShiftApp:
             
             pop_size = self.config.get("population_size", 50000)
             gens = self.config.get("generations", 1000)
+            num_threads = self.config.get("num_threads", 0)
+            chunk_size = self.config.get("chunk_size", 0)
 
-            self.log(f"Rustエンジン起動 (個体数:{pop_size})...")
+            workers = self.config.get("portfolio_workers", 1)
+
+            thread_label = num_threads if num_threads > 0 else "自動"
             start_time = time.time()
-            
-            result_schedule, score = ShiftScheduler.run_genetic_algorithm(
-                roles_list, constraints, days_count, staff_count, pop_size, gens
-            )
+
+            if workers > 1:
+                # 設定を変えた複数の計算を同時に走らせ、一番早く目標に届いたものを使う
+                # (個体数・スレッド数は config.json の値を全プロセスで分け合う)
+                from portfolio import default_strategies, run_portfolio
+                budget = self.config.get("portfolio_time_budget", 60)
+                self.log(f"Rustエンジン起動 (ポートフォリオ:{workers}並列 / 制限時間:{budget}秒)...")
+                strategies = default_strategies(workers, pop_size)
+                result_schedule, score, strategy, _ = run_portfolio(
+                    roles_list, constraints, days_count, staff_count, strategies,
+                    generations=gens, time_budget=budget, num_threads=num_threads, log=self.log
+                )
+                self.log(f"採用した設定: {strategy}")
+            else:
+                self.log(f"Rustエンジン起動 (個体数:{pop_size} / スレッド数:{thread_label})...")
+                result_schedule, score, op_stats = ShiftScheduler.run_genetic_algorithm(
+                    roles_list, constraints, days_count, staff_count, pop_size, gens,
+                    num_threads, chunk_size, return_stats=True
+                )
+                self.log_operator_stats(op_stats)
             
             elapsed = time.time() - start_time
             self.log(f"計算完了: {elapsed:.2f}秒 (スコア: {score})")
@@ -236,11 +322,20 @@ class ShiftApp:
         finally:
             self.root.after(0, self.reset_gui)
 
+    def log_operator_stats(self, op_stats):
+        # 交叉・突然変異の種類ごとに「親より良くなった割合」と最終的な選択確率を表示
+        labels = {"crossover": "交叉", "mutation": "突然変異"}
+        for kind, ops in op_stats.items():
+            parts = [f"{name} 改善率{s['rate']:.1%}(選択率{s['probability']:.0%})" for name, s in ops.items()]
+            self.log(f"{labels.get(kind, kind)}: " + " / ".join(parts))
+
     def reset_gui(self):
         self.btn_run.config(state="normal", text="シフト生成開始 (Rust実行)")
         self.status_var.set("待機中")
 
     def load_data_clean(self, filename):
+        import openpyxl
+
         wb = openpyxl.load_workbook(filename)
         ws = wb.active
         headers = [cell.value for cell in ws[1]]
@@ -307,6 +402,9 @@ class ShiftApp:
         self.log("------------------------")
 
     def save_data(self, schedule, roles_list, names, date_labels, filename):
+        import openpyxl
+        from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+
         wb = openpyxl.Workbook()
         ws = wb.active
         ws.title = "シフト表"
@@ -345,6 +443,19 @@ class ShiftApp:
         wb.save(filename)
 
 if __name__ == "__main__":
+    # exe化したときにポートフォリオ実行の子プロセスが GUI を起動しないように
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = ShiftApp(root)
+
+    # bench_startup.py から起動された場合は、準備完了後に計測結果を出力して終了する
+    if os.environ.get("SHIFTAPP_STARTUP_BENCH"):
+        def report_and_quit():
+            if "ready" not in app.startup_times:
+                root.after(10, report_and_quit)
+                return
+            print(json.dumps(app.startup_times))
+            root.destroy()
+        root.after(10, report_and_quit)
+
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,149 @@
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+
+# --- ポートフォリオ実行 ---
+# 設定(シード・個体数・突然変異率・初期化方法)を変えた複数の計算を別プロセスで同時に走らせ、
+# どれかが目標スコアに届くか制限時間が来たら残りを止めて、一番良い結果を返す。
+
+# 中断を伝えてから各プロセスが結果を返すまで待つ時間 [秒]
+STOP_GRACE = 5.0
+# 共有ベストスコアの初期値 (まだ誰も採点していない)
+NO_SCORE = -2**31 + 1
+
+def default_strategies(workers, population_size, seed=None):
+    """個体数・突然変異率・初期化方法をずらした戦略リストを作る
+
+    population_size は全プロセス合計の個体数 (各戦略の個体数の合計がこれになる)
+    """
+    rng = random.Random(seed)
+    # 平均 (population_size / workers) に対する倍率
+    population_weights = [1.0, 0.5, 1.5]
+    mutation_rates = [0.2, 0.1, 0.4]
+    init_modes = ["random", "constraint"]
+
+    weights = [population_weights[i % len(population_weights)] for i in range(workers)]
+    populations = [max(int(population_size * w / sum(weights)), 10) for w in weights]
+    # 切り捨てで余った分は最初の戦略に足して、合計を population_size に揃える
+    populations[0] += max(population_size - sum(populations), 0)
+
+    strategies = []
+    for i in range(workers):
+        strategies.append({
+            "seed": rng.getrandbits(63),
+            "population_size": populations[i],
+            # 1周 (len(population_weights) 人) ごとにずらして、個体数と突然変異率の組み合わせが重ならないようにする
+            "mutation_rate": mutation_rates[(i + i // len(population_weights)) % len(mutation_rates)],
+            "init_mode": init_modes[i % len(init_modes)],
+        })
+    return strategies
+
+def _worker(index, strategy, problem, target_score, deadline, num_threads, best_score, stop_event, result_queue):
+    roles_list, constraints, days, staff_count, generations = problem
+
+    def on_generation(generation, score):
+        # 全プロセス共通のベストスコアを更新し、他が目標に届いていたら中断する
+        with best_score.get_lock():
+            if score > best_score.value:
+                best_score.value = score
+        return stop_event.is_set()
+
+    start = time.perf_counter()
+    try:
+        import ShiftScheduler # type: ignore
+        schedule, score = ShiftScheduler.run_genetic_algorithm(
+            roles_list, constraints, days, staff_count,
+            strategy["population_size"], generations,
+            num_threads=num_threads,
+            seed=strategy["seed"],
+            mutation_rate=strategy["mutation_rate"],
+            init_mode=strategy["init_mode"],
+            target_score=target_score,
+            time_limit=max(deadline - time.time(), 0.001),
+            callback=on_generation,
+            verbose=False,
+        )
+    except Exception as e:
+        result_queue.put((index, None, None, time.perf_counter() - start, str(e)))
+        return
+
+    if score >= target_score:
+        stop_event.set()
+    result_queue.put((index, score, schedule, time.perf_counter() - start, None))
+
+def run_portfolio(roles_list, constraints, days, staff_count, strategies,
+                  generations=1000, target_score=100, time_budget=60.0, num_threads=0, log=print):
+    """strategies を並列に実行し、(ベストのシフト, スコア, 戦略, 結果一覧) を返す
+
+    num_threads は全プロセス合計のスレッド数 (0 なら論理コア数)。プロセス数で割って各プロセスに配る
+    """
+    if not strategies:
+        raise ValueError("strategies が空です")
+    total_threads = num_threads if num_threads > 0 else (os.cpu_count() or 1)
+    num_threads = max(total_threads // len(strategies), 1)
+
+    # Windows (exe) でも動くように spawn で起動する
+    ctx = mp.get_context("spawn")
+    best_score = ctx.Value("i", NO_SCORE)
+    stop_event = ctx.Event()
+    result_queue = ctx.Queue()
+
+    problem = (roles_list, constraints, days, staff_count, generations)
+    deadline = time.time() + time_budget
+
+    processes = []
+    for i, strategy in enumerate(strategies):
+        p = ctx.Process(
+            target=_worker,
+            args=(i, strategy, problem, target_score, deadline, num_threads, best_score, stop_event, result_queue),
+            daemon=True,
+        )
+        p.start()
+        processes.append(p)
+
+    results = {}
+    lost = set()
+    last_reported = None
+    hard_deadline = deadline + STOP_GRACE
+    while len(results) + len(lost) < len(processes) and time.time() < hard_deadline:
+        # get の前に終了済みだったプロセスの結果は、もうキューに届いているはず
+        exited = [i for i, p in enumerate(processes) if not p.is_alive()]
+        try:
+            index, score, schedule, elapsed, error = result_queue.get(timeout=1.0)
+        except queue.Empty:
+            # 結果を返さずに落ちたプロセス (import失敗・panic・メモリ不足など) は待たない
+            for i in exited:
+                if i not in results and i not in lost:
+                    lost.add(i)
+                    log(f"戦略{i}: 結果を返さずに終了しました (exitcode={processes[i].exitcode})")
+            # 途中経過: 全プロセス共通のベストスコア
+            if best_score.value != last_reported and best_score.value != NO_SCORE:
+                last_reported = best_score.value
+                log(f"現在のベストスコア: {last_reported}")
+            continue
+        results[index] = (score, schedule, elapsed, error)
+        if error is not None:
+            log(f"戦略{index}: エラー {error}")
+            continue
+        log(f"戦略{index}: スコア {score} ({elapsed:.2f}秒) {strategies[index]}")
+        if score >= target_score:
+            stop_event.set()
+        # 誰かが目標に届いたら、残りは STOP_GRACE 秒だけ待って打ち切る
+        if stop_event.is_set():
+            hard_deadline = min(hard_deadline, time.time() + STOP_GRACE)
+
+    stop_event.set()
+    for p in processes:
+        p.join(timeout=0.1)
+        if p.is_alive():
+            p.terminate()
+            p.join()
+
+    finished = {i: r for i, r in results.items() if r[3] is None}
+    if not finished:
+        raise RuntimeError("どの戦略も結果を返しませんでした")
+    best_index = max(finished, key=lambda i: finished[i][0])
+    best_result_score, best_schedule, _, _ = finished[best_index]
+    return best_schedule, best_result_score, strategies[best_index], results
@@ -7,6 +7,8 @@ from openpyxl.styles import PatternFill, Font, Alignment, Border, Side # type: i
 # ※ DAYS はExcelから自動取得するので削除
 POPULATION_SIZE = 50000
 GENERATIONS = 1000     
+NUM_THREADS = 0        # 0 = 論理コア数ぶん使う
+CHUNK_SIZE = 0         # 0 = rayon に任せる
 
 INPUT_FILE = "staff_request.xlsx"
 OUTPUT_FILE = "shift_result.xlsx"
@@ -144,19 +146,27 @@ def main():
     start_time = time.time()
 
     # 2. Rust実行 (期間 days_count を渡す)
-    result_schedule, score = ShiftScheduler.run_genetic_algorithm(
+    result_schedule, score, op_stats = ShiftScheduler.run_genetic_algorithm(
         roles_list,
         constraints,
         days_count, # ここが自動で変わる
         staff_count,
         POPULATION_SIZE,
-        GENERATIONS
+        GENERATIONS,
+        NUM_THREADS,
+        CHUNK_SIZE,
+        return_stats=True
     )
 
     end_time = time.time()
     print(f"処理完了！ 経過時間: {end_time - start_time:.2f}秒")
     print(f"最終スコア: {score}")
 
+    # オペレーターごとの成績 (使用回数 / 親より良くなった回数 / 最終的な選択確率)
+    for kind, ops in op_stats.items():
+        for name, s in ops.items():
+            print(f"  {kind:<9} {name:<5} 使用{s['used']:>9} 改善{s['improved']:>8} ({s['rate']:.1%}) 選択率{s['probability']:.0%}")
+
     # 3. 保存 (date_labels を渡す)
     save_to_excel(result_schedule, roles_list, names_dict, date_labels, OUTPUT_FILE)
 
@@ -1,7 +1,11 @@
 use pyo3::prelude::*;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::types::PyDict;
+use pyo3::IntoPyObjectExt;
 use rayon::prelude::*;
 use rayon::slice::ParallelSliceMut;
 use std::collections::HashMap;
+use std::time::{Duration, Instant};
 use rand::prelude::*;
 
 // --- 採点ロジック ---
@@ -98,50 +102,402 @@ fn calculate_single_score(
     score
 }
 
+// --- 乱数生成器 ---
+// seed 指定時は (seed, stream) から決まる乱数列を使い、同じ設定なら同じ結果を再現できるようにする
+fn make_rng(seed: Option<u64>, stream: u64) -> StdRng {
+    match seed {
+        Some(s) => StdRng::seed_from_u64(s ^ stream.wrapping_mul(0x9E37_79B9_7F4A_7C15)),
+        None => StdRng::from_rng(rand::thread_rng()).unwrap(),
+    }
+}
+
+// --- 初期個体の生成 ---
+// "random": 全セルを一様ランダム
+// "constraint": 希望休 (NG / 朝のみ / 夜のみ) を守った状態から始める
+fn random_schedule(
+    rng: &mut StdRng,
+    constraints: &HashMap<(usize, usize), String>,
+    days: usize,
+    staff_count: usize,
+    respect_constraints: bool
+) -> Vec<Vec<i32>> {
+    let mut schedule = Vec::with_capacity(staff_count);
+    for staff_idx in 0..staff_count {
+        let mut row = Vec::with_capacity(days);
+        for day in 0..days {
+            let shift = match (respect_constraints, constraints.get(&(staff_idx, day))) {
+                (true, Some(c)) if c == "NG" => 0,
+                (true, Some(c)) if c == "NO_MORNING" => if rng.gen_bool(0.5) { 0 } else { 2 },
+                (true, Some(c)) if c == "NO_NIGHT" => if rng.gen_bool(0.5) { 0 } else { 1 },
+                _ => rng.gen_range(0..=2),
+            };
+            row.push(shift);
+        }
+        schedule.push(row);
+    }
+    schedule
+}
+
+// --- 交叉・突然変異オペレーター ---
+// 交叉: Row = スタッフ(行)で1点交叉 / Day = 日付(列)で1点交叉 / Block = スタッフx1週間のブロックごとに親を選ぶ
+// 突然変異: Cell = 1マス変更 / Swap = 同じスタッフの違う2日を入れ替え(勤務日数は変わらない) / Multi = 2〜4マス変更
+#[derive(Clone, Copy, PartialEq, Debug)]
+enum Crossover { Row, Day, Block }
+
+#[derive(Clone, Copy, PartialEq, Debug)]
+enum Mutation { Cell, Swap, Multi }
+
+// OperatorPool の添字 → オペレーター (名前は統計表示用)
+const CROSSOVER_OPS: [Crossover; 3] = [Crossover::Row, Crossover::Day, Crossover::Block];
+const CROSSOVER_NAMES: [&str; 3] = ["row", "day", "block"];
+const MUTATION_OPS: [Mutation; 3] = [Mutation::Cell, Mutation::Swap, Mutation::Multi];
+const MUTATION_NAMES: [&str; 3] = ["cell", "swap", "multi"];
+const BLOCK_DAYS: usize = 7;
+// Swap で入れ替えられる2日 (値が違う2日) が見つからないときに別スタッフを試す回数
+const SWAP_ATTEMPTS: usize = 8;
+
+fn crossover(op: Crossover, rng: &mut StdRng, parent1: &Vec<Vec<i32>>, parent2: &Vec<Vec<i32>>, days: usize, staff_count: usize) -> Vec<Vec<i32>> {
+    let mut child = parent1.clone();
+    match op {
+        Crossover::Day if days >= 2 => {
+            // 人数チェックは日付ごとなので、列ごと受け継ぐと人手不足が直りやすい
+            let split = rng.gen_range(1..days);
+            for i in 0..staff_count {
+                child[i][split..].copy_from_slice(&parent2[i][split..]);
+            }
+        }
+        Crossover::Block => {
+            for i in 0..staff_count {
+                for start in (0..days).step_by(BLOCK_DAYS) {
+                    if rng.gen_bool(0.5) {
+                        let end = (start + BLOCK_DAYS).min(days);
+                        child[i][start..end].copy_from_slice(&parent2[i][start..end]);
+                    }
+                }
+            }
+        }
+        // Row (期間が1日しかないときは Day もこちら)
+        _ if staff_count >= 2 => {
+            let split = rng.gen_range(1..staff_count);
+            for i in split..staff_count {
+                child[i] = parent2[i].clone();
+            }
+        }
+        // 1人x1日では分けようがないので親1のまま
+        _ => {}
+    }
+    child
+}
+
+// 子が実際に変わったら true を返す (何も変わらなかった突然変異は成績に数えない)
+fn mutate(op: Mutation, rng: &mut StdRng, child: &mut Vec<Vec<i32>>, days: usize, staff_count: usize) -> bool {
+    match op {
+        Mutation::Cell => {
+            let m_staff = rng.gen_range(0..staff_count);
+            let m_day = rng.gen_range(0..days);
+            let old = child[m_staff][m_day];
+            child[m_staff][m_day] = rng.gen_range(0..=2);
+            child[m_staff][m_day] != old
+        }
+        Mutation::Swap => {
+            // 値が違う2日を選ぶ (同じ値どうしの入れ替えは何も変わらないので使わない)
+            for _ in 0..SWAP_ATTEMPTS {
+                let row = &mut child[rng.gen_range(0..staff_count)];
+                let day1 = rng.gen_range(0..days);
+                let shift1 = row[day1];
+                let candidates = row.iter().filter(|&&s| s != shift1).count();
+                if candidates == 0 { continue; }
+                let pick = rng.gen_range(0..candidates);
+                let day2 = (0..days).filter(|&d| row[d] != shift1).nth(pick).unwrap();
+                row.swap(day1, day2);
+                return true;
+            }
+            false
+        }
+        Mutation::Multi => {
+            // 同じマスを2回変えて元に戻ることもあるので、最初の値と最後の値で比べる
+            let mut touched: Vec<(usize, usize, i32)> = Vec::with_capacity(4);
+            for _ in 0..rng.gen_range(2..=4) {
+                let m_staff = rng.gen_range(0..staff_count);
+                let m_day = rng.gen_range(0..days);
+                if !touched.iter().any(|&(s, d, _)| s == m_staff && d == m_day) {
+                    touched.push((m_staff, m_day, child[m_staff][m_day]));
+                }
+                child[m_staff][m_day] = rng.gen_range(0..=2);
+            }
+            touched.iter().any(|&(s, d, old)| child[s][d] != old)
+        }
+    }
+}
+
+// 子がどのオペレーターで作られたか (次の世代の採点で親より良くなったかを数える)
+#[derive(Clone, Copy)]
+struct Origin {
+    crossover: usize,
+    mutation: Option<usize>,
+    parent_score: i32,
+}
+
+// --- オペレーターの適応的選択 ---
+// 「親より良い子を作れた割合」の移動平均に比例して選ばれやすくする (最低確率 OP_MIN_PROB は保証)
+const OP_ADAPT_RATE: f64 = 0.3;
+const OP_MIN_PROB: f64 = 0.1;
+
+struct OperatorPool {
+    names: &'static [&'static str],
+    quality: Vec<f64>,
+    probs: Vec<f64>,
+    used: Vec<usize>,
+    improved: Vec<usize>,
+}
+
+impl OperatorPool {
+    fn new(names: &'static [&'static str]) -> Self {
+        let n = names.len();
+        OperatorPool {
+            names,
+            quality: vec![0.0; n],
+            probs: vec![1.0 / n as f64; n],
+            used: vec![0; n],
+            improved: vec![0; n],
+        }
+    }
+
+    fn pick(&self, rng: &mut StdRng) -> usize {
+        let mut r: f64 = rng.gen_range(0.0..1.0);
+        for (i, p) in self.probs.iter().enumerate() {
+            if r < *p { return i; }
+            r -= p;
+        }
+        self.probs.len() - 1
+    }
+
+    // 1世代分の結果 (使われた回数 / 改善した回数) で確率を更新する
+    fn update(&mut self, used: &[usize], improved: &[usize]) {
+        let n = self.names.len();
+        for i in 0..n {
+            self.used[i] += used[i];
+            self.improved[i] += improved[i];
+            if used[i] > 0 {
+                let rate = improved[i] as f64 / used[i] as f64;
+                self.quality[i] = (1.0 - OP_ADAPT_RATE) * self.quality[i] + OP_ADAPT_RATE * rate;
+            }
+        }
+        let total: f64 = self.quality.iter().sum();
+        for i in 0..n {
+            self.probs[i] = if total > 0.0 {
+                OP_MIN_PROB + (1.0 - n as f64 * OP_MIN_PROB) * self.quality[i] / total
+            } else {
+                1.0 / n as f64
+            };
+        }
+    }
+
+    fn summary(&self) -> String {
+        self.names.iter().zip(&self.probs)
+            .map(|(name, p)| format!("{}={:.2}", name, p))
+            .collect::<Vec<_>>()
+            .join(" ")
+    }
+
+    fn to_dict<'py>(&self, py: Python<'py>, stats: &Bound<'py, PyDict>) -> PyResult<()> {
+        for i in 0..self.names.len() {
+            let entry = PyDict::new(py);
+            entry.set_item("used", self.used[i])?;
+            entry.set_item("improved", self.improved[i])?;
+            let rate = if self.used[i] > 0 { self.improved[i] as f64 / self.used[i] as f64 } else { 0.0 };
+            entry.set_item("rate", rate)?;
+            entry.set_item("probability", self.probs[i])?;
+            stats.set_item(self.names[i], entry)?;
+        }
+        Ok(())
+    }
+}
+
 // --- 遺伝的アルゴリズム本体 ---
+// num_threads: 0 なら論理コア数ぶん、それ以外は指定スレッド数の専用プールで実行
+// chunk_size: 採点・子生成ループで1タスクが最低限受け持つ個体数 (0 なら rayon 任せ)
+// seed: 乱数シード (None ならランダム)
+// mutation_rate: 子に突然変異を入れる確率
+// init_mode: 初期個体の作り方 ("random" / "constraint")
+// target_score: このスコア以上が出たら終了
+// time_limit: 計算時間の上限 [秒] (0 以下・inf なら無制限)
+// callback: 毎世代 callback(世代, ベストスコア) を呼び、True が返ったらその時点のベストで終了
+// verbose: 途中経過を表示するか
+// return_stats: True なら (シフト, スコア, オペレーター統計) を返す
 #[pyfunction]
+#[pyo3(signature = (
+    roles, constraints, days, staff_count, population_size, generations,
+    num_threads=0, chunk_size=0, seed=None, mutation_rate=0.2, init_mode="random",
+    target_score=100, time_limit=0.0, callback=None, verbose=true, return_stats=false
+))]
 fn run_genetic_algorithm(
+    py: Python<'_>,
     roles: Vec<String>,
     constraints: HashMap<(usize, usize), String>,
     days: usize,
     staff_count: usize,
     population_size: usize,
-    generations: usize
-) -> PyResult<(Vec<Vec<i32>>, i32)> {
+    generations: usize,
+    num_threads: usize,
+    chunk_size: usize,
+    seed: Option<u64>,
+    mutation_rate: f64,
+    init_mode: &str,
+    target_score: i32,
+    time_limit: f64,
+    callback: Option<Py<PyAny>>,
+    verbose: bool,
+    return_stats: bool
+) -> PyResult<Py<PyAny>> {
+
+    if !(0.0..=1.0).contains(&mutation_rate) {
+        return Err(PyValueError::new_err(format!("mutation_rate は 0〜1 で指定してください: {}", mutation_rate)));
+    }
+    let respect_constraints = match init_mode {
+        "random" => false,
+        "constraint" => true,
+        _ => return Err(PyValueError::new_err(format!("不明な init_mode です: {}", init_mode))),
+    };
+
+    // グローバルプールは使わず、呼び出しごとに専用プールを作る
+    // (GUIや別の計算と同時に動かしてもスレッドを取り合わないように)
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(num_threads)
+        .build()
+        .map_err(|e| PyRuntimeError::new_err(format!("スレッドプール作成失敗: {}", e)))?;
+
+    let settings = Settings {
+        population_size,
+        generations,
+        min_len: chunk_size.max(1),
+        seed,
+        mutation_rate,
+        respect_constraints,
+        target_score,
+        // inf や Instant に足せないほど大きい値は「制限なし」として扱う
+        deadline: if time_limit > 0.0 {
+            Duration::try_from_secs_f64(time_limit).ok().and_then(|d| Instant::now().checked_add(d))
+        } else {
+            None
+        },
+        verbose,
+    };
+
+    // 計算中は GIL を手放す (GUIスレッドや callback を止めないように)
+    let result = py.detach(|| {
+        pool.install(|| evolve(&roles, &constraints, days, staff_count, &settings, callback.as_ref()))
+    })?;
+
+    if return_stats {
+        let stats = PyDict::new(py);
+        let crossover_stats = PyDict::new(py);
+        result.crossover_ops.to_dict(py, &crossover_stats)?;
+        stats.set_item("crossover", crossover_stats)?;
+        let mutation_stats = PyDict::new(py);
+        result.mutation_ops.to_dict(py, &mutation_stats)?;
+        stats.set_item("mutation", mutation_stats)?;
+        (result.schedule, result.score, stats).into_py_any(py)
+    } else {
+        (result.schedule, result.score).into_py_any(py)
+    }
+}
+
+struct Settings {
+    population_size: usize,
+    generations: usize,
+    min_len: usize,
+    seed: Option<u64>,
+    mutation_rate: f64,
+    respect_constraints: bool,
+    target_score: i32,
+    deadline: Option<Instant>,
+    verbose: bool,
+}
+
+struct EvolveResult {
+    schedule: Vec<Vec<i32>>,
+    score: i32,
+    crossover_ops: OperatorPool,
+    mutation_ops: OperatorPool,
+}
+
+fn evolve(
+    roles: &Vec<String>,
+    constraints: &HashMap<(usize, usize), String>,
+    days: usize,
+    staff_count: usize,
+    settings: &Settings,
+    callback: Option<&Py<PyAny>>
+) -> PyResult<EvolveResult> {
+    let population_size = settings.population_size;
+    let min_len = settings.min_len;
+
+    let mut crossover_ops = OperatorPool::new(&CROSSOVER_NAMES);
+    let mut mutation_ops = OperatorPool::new(&MUTATION_NAMES);
 
     // 初期個体
-    let mut population: Vec<Vec<Vec<i32>>> = (0..population_size).into_par_iter().map(|_| {
-        let mut rng = rand::thread_rng();
-        let mut schedule = Vec::with_capacity(staff_count);
-        for _ in 0..staff_count {
-            let mut row = Vec::with_capacity(days);
-            for _ in 0..days {
-                row.push(rng.gen_range(0..=2));
-            }
-            schedule.push(row);
-        }
-        schedule
+    let mut population: Vec<Vec<Vec<i32>>> = (0..population_size).into_par_iter().with_min_len(min_len).map(|idx| {
+        let mut rng = make_rng(settings.seed, idx as u64);
+        random_schedule(&mut rng, constraints, days, staff_count, settings.respect_constraints)
     }).collect();
+    // 初期個体・エリートは None
+    let mut origins: Vec<Option<Origin>> = vec![None; population_size];
 
-    for generation_idx in 0..generations {
+    for generation_idx in 0..settings.generations {
         // 採点
-        let mut scored_population: Vec<(i32, Vec<Vec<i32>>)> = population.par_iter()
-            .map(|sch| {
-                let s = calculate_single_score(sch, &roles, &constraints, days, staff_count);
-                (s, sch.clone())
-            })
+        let scores: Vec<i32> = population.par_iter()
+            .with_min_len(min_len)
+            .map(|sch| calculate_single_score(sch, roles, constraints, days, staff_count))
             .collect();
 
+        // 前の世代で使ったオペレーターの成績を集計して確率を更新
+        let mut crossover_used = vec![0; CROSSOVER_NAMES.len()];
+        let mut crossover_improved = vec![0; CROSSOVER_NAMES.len()];
+        let mut mutation_used = vec![0; MUTATION_NAMES.len()];
+        let mut mutation_improved = vec![0; MUTATION_NAMES.len()];
+        for (origin, &score) in origins.iter().zip(&scores) {
+            if let Some(o) = origin {
+                let improved = (score > o.parent_score) as usize;
+                crossover_used[o.crossover] += 1;
+                crossover_improved[o.crossover] += improved;
+                if let Some(m) = o.mutation {
+                    mutation_used[m] += 1;
+                    mutation_improved[m] += improved;
+                }
+            }
+        }
+        crossover_ops.update(&crossover_used, &crossover_improved);
+        mutation_ops.update(&mutation_used, &mutation_improved);
+
+        let mut scored_population: Vec<(i32, Vec<Vec<i32>>)> = scores.into_iter().zip(population).collect();
         scored_population.par_sort_unstable_by(|a, b| b.0.cmp(&a.0));
 
-        if scored_population[0].0 == 100 {
-            let (best_score, best_schedule) = &scored_population[0];
-            println!("Rust: Generation {} found 100 score!", generation_idx);
-            return Ok((best_schedule.clone(), *best_score));
+        let best_score = scored_population[0].0;
+        if best_score >= settings.target_score {
+            if settings.verbose {
+                println!("Rust: Generation {} found {} score!", generation_idx, best_score);
+            }
+            let schedule = scored_population.swap_remove(0).1;
+            return Ok(EvolveResult { schedule, score: best_score, crossover_ops, mutation_ops });
         }
         
-        if generation_idx % 5 == 0 {
-            println!("Rust: Gen {} Best Score = {}", generation_idx, scored_population[0].0);
+        if settings.verbose && generation_idx % 5 == 0 {
+            println!("Rust: Gen {} Best Score = {} | {} | {}", generation_idx, best_score, crossover_ops.summary(), mutation_ops.summary());
+        }
+
+        // 打ち切り判定 (時間切れ / 呼び出し側からの中断)
+        let timed_out = settings.deadline.map_or(false, |d| Instant::now() >= d);
+        let cancelled = match callback {
+            Some(cb) => Python::attach(|py| cb.bind(py).call1((generation_idx, best_score))?.is_truthy())?,
+            None => false,
+        };
+        if timed_out || cancelled {
+            if settings.verbose {
+                println!("Rust: Gen {} stopped (Best Score = {})", generation_idx, best_score);
+            }
+            let schedule = scored_population.swap_remove(0).1;
+            return Ok(EvolveResult { schedule, score: best_score, crossover_ops, mutation_ops });
         }
 
         // 次世代生成
@@ -153,34 +509,37 @@ fn run_genetic_algorithm(
         }
 
         let num_children = population_size - elite_count;
-        let children: Vec<Vec<Vec<i32>>> = (0..num_children).into_par_iter().map(|_| {
-            let mut rng = rand::thread_rng();
+        let stream_base = ((generation_idx + 1) * population_size) as u64;
+        let (children, child_origins): (Vec<Vec<Vec<i32>>>, Vec<Option<Origin>>) = (0..num_children).into_par_iter().with_min_len(min_len).map(|idx| {
+            let mut rng = make_rng(settings.seed, stream_base + idx as u64);
             let parent_idx1 = rng.gen_range(0..(population_size / 2));
             let parent_idx2 = rng.gen_range(0..(population_size / 2));
-            let parent1 = &scored_population[parent_idx1].1;
-            let parent2 = &scored_population[parent_idx2].1;
+            let (score1, parent1) = &scored_population[parent_idx1];
+            let (score2, parent2) = &scored_population[parent_idx2];
 
-            let mut child = parent1.clone();
-            let split = rng.gen_range(1..staff_count);
-            for i in split..staff_count {
-                child[i] = parent2[i].clone();
-            }
+            let crossover_op = crossover_ops.pick(&mut rng);
+            let mut child = crossover(CROSSOVER_OPS[crossover_op], &mut rng, parent1, parent2, days, staff_count);
 
-            if rng.gen_bool(0.2) {
-                let m_staff = rng.gen_range(0..staff_count);
-                let m_day = rng.gen_range(0..days);
-                child[m_staff][m_day] = rng.gen_range(0..=2);
+            let mut mutation_op = None;
+            if rng.gen_bool(settings.mutation_rate) {
+                let op = mutation_ops.pick(&mut rng);
+                if mutate(MUTATION_OPS[op], &mut rng, &mut child, days, staff_count) {
+                    mutation_op = Some(op);
+                }
             }
-            child
-        }).collect();
+            let origin = Origin { crossover: crossover_op, mutation: mutation_op, parent_score: (*score1).max(*score2) };
+            (child, Some(origin))
+        }).unzip();
 
         next_gen.extend(children);
         population = next_gen;
+        origins = vec![None; elite_count];
+        origins.extend(child_origins);
     }
 
-    let best_schedule = &population[0];
-    let score = calculate_single_score(best_schedule, &roles, &constraints, days, staff_count);
-    Ok((best_schedule.clone(), score))
+    let schedule = population.swap_remove(0);
+    let score = calculate_single_score(&schedule, roles, constraints, days, staff_count);
+    Ok(EvolveResult { schedule, score, crossover_ops, mutation_ops })
 }
 
 #[pymodule]
@@ -188,4 +547,146 @@ fn run_genetic_algorithm(
 fn ShiftScheduler(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(run_genetic_algorithm, m)?)?;
     Ok(())
-}
\ No newline at end of file
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn sample_schedule(seed: u64, days: usize, staff_count: usize) -> Vec<Vec<i32>> {
+        let mut rng = make_rng(Some(seed), 0);
+        random_schedule(&mut rng, &HashMap::new(), days, staff_count, false)
+    }
+
+    fn work_days(row: &Vec<i32>) -> usize {
+        row.iter().filter(|&&s| s != 0).count()
+    }
+
+    #[test]
+    fn swap_keeps_work_days_and_changes_row() {
+        for seed in 0..200 {
+            let original = sample_schedule(seed, 31, 20);
+            let mut child = original.clone();
+            let mut rng = make_rng(Some(seed), 1);
+            assert!(mutate(Mutation::Swap, &mut rng, &mut child, 31, 20));
+
+            assert_ne!(child, original, "seed {}: swap が何も変えていない", seed);
+            for (before, after) in original.iter().zip(&child) {
+                assert_eq!(work_days(before), work_days(after));
+                let mut a = before.clone();
+                let mut b = after.clone();
+                a.sort();
+                b.sort();
+                assert_eq!(a, b);
+            }
+        }
+    }
+
+    #[test]
+    fn mutate_reports_whether_child_changed() {
+        // 全員・全日が同じ値なら swap は入れ替えようがない
+        let mut uniform = vec![vec![1; 31]; 20];
+        let mut rng = make_rng(Some(5), 0);
+        assert!(!mutate(Mutation::Swap, &mut rng, &mut uniform, 31, 20));
+        assert_eq!(uniform, vec![vec![1; 31]; 20]);
+
+        for seed in 0..200 {
+            for &op in MUTATION_OPS.iter() {
+                let original = sample_schedule(seed, 31, 20);
+                let mut child = original.clone();
+                let mut rng = make_rng(Some(seed), 2);
+                let changed = mutate(op, &mut rng, &mut child, 31, 20);
+                assert_eq!(changed, child != original, "{:?} seed {}", op, seed);
+            }
+        }
+    }
+
+    #[test]
+    fn crossover_takes_every_cell_from_a_parent() {
+        let parent1 = sample_schedule(1, 31, 20);
+        let parent2 = sample_schedule(2, 31, 20);
+        for (i, &op) in CROSSOVER_OPS.iter().enumerate() {
+            let mut rng = make_rng(Some(3), i as u64);
+            let child = crossover(op, &mut rng, &parent1, &parent2, 31, 20);
+            for s in 0..20 {
+                for d in 0..31 {
+                    assert!(child[s][d] == parent1[s][d] || child[s][d] == parent2[s][d], "{:?}", op);
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn crossover_handles_single_day_and_single_staff() {
+        for &(days, staff_count) in &[(1, 1), (1, 5), (5, 1)] {
+            let parent1 = sample_schedule(1, days, staff_count);
+            let parent2 = sample_schedule(2, days, staff_count);
+            for &op in CROSSOVER_OPS.iter() {
+                let mut rng = make_rng(Some(4), 0);
+                let child = crossover(op, &mut rng, &parent1, &parent2, days, staff_count);
+                assert_eq!(child.len(), staff_count);
+                assert!(child.iter().all(|row| row.len() == days));
+            }
+        }
+    }
+
+    #[test]
+    fn operator_pool_probabilities_sum_to_one_above_floor() {
+        let mut pool = OperatorPool::new(&CROSSOVER_NAMES);
+        let cases: [([usize; 3], [usize; 3]); 4] = [
+            ([100, 100, 100], [50, 0, 0]),
+            ([100, 0, 100], [0, 0, 0]),
+            ([10, 10, 10], [10, 1, 0]),
+            ([0, 0, 0], [0, 0, 0]),
+        ];
+        for (used, improved) in cases.iter() {
+            pool.update(used, improved);
+            let total: f64 = pool.probs.iter().sum();
+            assert!((total - 1.0).abs() < 1e-9, "合計 {}", total);
+            assert!(pool.probs.iter().all(|&p| p >= OP_MIN_PROB - 1e-12), "{:?}", pool.probs);
+        }
+        assert_eq!(pool.used, vec![210, 110, 210]);
+        assert_eq!(pool.improved, vec![60, 1, 0]);
+        // 改善率が一番高いものが一番選ばれやすい
+        assert!(pool.probs[0] > pool.probs[1] && pool.probs[1] > pool.probs[2]);
+    }
+
+    #[test]
+    fn make_rng_same_seed_same_sequence() {
+        let sequence = |seed, stream| {
+            let mut rng = make_rng(Some(seed), stream);
+            (0..16).map(|_| rng.gen_range(0..1000)).collect::<Vec<u32>>()
+        };
+        assert_eq!(sequence(42, 7), sequence(42, 7));
+        assert_ne!(sequence(42, 7), sequence(42, 8));
+        assert_eq!(sample_schedule(42, 31, 20), sample_schedule(42, 31, 20));
+        assert_ne!(sample_schedule(42, 31, 20), sample_schedule(43, 31, 20));
+    }
+
+    #[test]
+    fn evolve_same_seed_same_schedule() {
+        let roles: Vec<String> = ["Chief", "Chief", "Leader", "Staff", "Assist", "Assist"]
+            .iter().map(|r| r.to_string()).collect();
+        let mut constraints = HashMap::new();
+        constraints.insert((0, 3), "NG".to_string());
+        constraints.insert((4, 10), "NO_NIGHT".to_string());
+        let settings = Settings {
+            population_size: 200,
+            generations: 10,
+            min_len: 1,
+            seed: Some(12345),
+            mutation_rate: 0.2,
+            respect_constraints: true,
+            target_score: i32::MAX,
+            deadline: None,
+            verbose: false,
+        };
+        let pool = rayon::ThreadPoolBuilder::new().num_threads(2).build().unwrap();
+        let run = || pool.install(|| evolve(&roles, &constraints, 14, roles.len(), &settings, None)).unwrap();
+        let first = run();
+        let second = run();
+        assert_eq!(first.schedule, second.schedule);
+        assert_eq!(first.score, second.score);
+        assert_eq!(first.crossover_ops.used, second.crossover_ops.used);
+    }
+}